@@ -3,217 +3,341 @@
 """
 Basic Electrical Engineering Equations (Interactive CLI)
 
-Variables (as requested):
-I  = Amps
-V  = Volts (RMS). For THREE-PHASE, use LINE-TO-LINE voltage (V_LL).
-KVA = Kilo Volt-Amps (apparent power)
-KW  = Kilo Watts (real power)
-PF  = Power Factor (0–1)
-W   = Watts (real power)
-
-Formulas implemented:
-
-Single-phase
-------------
-I   = (1000*KW) / (V*PF)
-I   = (1000*KVA) / V
-I   =  W / (V*PF)
-
-KW  = (V*I*PF) / 1000            => W = V*I*PF
-KVA = (V*I) / 1000               =>  VA = V*I
-
-Three-phase (balanced, using line-to-line voltage V)
----------------------------------------------------
-I   = (1000*KW) / (sqrt(3)*V*PF)
-I   = (1000*KVA) / (sqrt(3)*V)
-I   =  W / (sqrt(3)*V*PF)
-
-KW  = (sqrt(3)*V*I*PF) / 1000    => W  = sqrt(3)*V*I*PF
-KVA = (sqrt(3)*V*I) / 1000       => VA = sqrt(3)*V*I
-
-Handy relations: KW = KVA * PF, and W = 1000*KW, VA = 1000*KVA
+Menu-driven front end for the equations in ee_equations.py; see that
+module for the variables and formulas.
 """
-from math import sqrt
+import re
+import sys
+import warnings
 
-SQRT3 = sqrt(3.0)
+import numpy as np
+
+from ee_equations import *
 
 # ---------- Helper input utilities ----------
+_STDIN = sys.stdin
+
+# Piped/scripted runs skip the "Press Enter" pauses and menu banners so the
+# output is just prompts and results.
+_INTERACTIVE = sys.stdin.isatty() and sys.stdout.isatty()
+
+def _readline(prompt):
+    # Lighter than input(): one write and one readline on the already-open
+    # streams, which adds up when a batch of values is piped in.
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return _STDIN.readline()
+
+# Plain decimal/exponent numbers: these parse with float() straight away, so
+# the common case runs without an exception handler around it.
+_NUM_RE = re.compile(r"^-?\d+(\.\d*)?([eE][-+]?\d+)?$")
+
 def ask_float(prompt, allow_zero=False, min_val=None, max_val=None):
+    _float = float
+    _match = _NUM_RE.match
     while True:
-        s = input(prompt).strip()
+        line = _readline(prompt)
+        if not line:
+            raise EOFError
+        s = line.rstrip("\n").strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        try:
-            x = float(s)
-            if not allow_zero and x == 0.0:
-                print("Value cannot be zero. Enter a non-zero value, or type 'q' to quit.")
-                continue
-            if min_val is not None and x < min_val:
-                print(f"Value must be ≥ {min_val}. Try again, or type 'q' to quit.")
-                continue
-            if max_val is not None and x > max_val:
-                print(f"Value must be ≤ {max_val}. Try again, or type 'q' to quit.")
+        if _match(s):
+            x = _float(s)
+        else:
+            # Anything else float() accepts: ".5", "+2", "1_000", "inf", ...
+            try:
+                x = _float(s)
+            except ValueError:
+                print("Please enter a valid number (or type 'q' to quit).")
                 continue
-            return x
+        if not allow_zero and x == 0.0:
+            print("Value cannot be zero. Enter a non-zero value, or type 'q' to quit.")
+            continue
+        if min_val is not None and x < min_val:
+            print("Value must be ≥ %s. Try again, or type 'q' to quit." % min_val)
+            continue
+        if max_val is not None and x > max_val:
+            print("Value must be ≤ %s. Try again, or type 'q' to quit." % max_val)
+            continue
+        return x
+
+def ask_int(prompt, min_val=None):
+    while True:
+        line = _readline(prompt)
+        if not line:
+            raise EOFError
+        s = line.strip()
+        if s.lower() in {"q", "quit", "exit"}:
+            raise KeyboardInterrupt
+        try:
+            n = int(s)
         except ValueError:
-            print("Please enter a valid number (or type 'q' to quit).")
+            print("Please enter a whole number (or type 'q' to quit).")
+            continue
+        if min_val is not None and n < min_val:
+            print("Value must be ≥ %d. Try again, or type 'q' to quit." % min_val)
+            continue
+        return n
 
-def pretty_number(x):
-    # Format numbers sensibly for engineering style outputs
-    if abs(x) >= 100:
-        return f"{x:,.2f}"
-    elif abs(x) >= 1:
-        return f"{x:,.4f}"
-    else:
-        return f"{x:.6f}"
+def ask_floats_line(prompt, n, allow_zero=False, min_val=None, max_val=None):
+    # Read n whitespace-separated numbers pasted on one line, parsed in a
+    # single pass into a contiguous float64 array for the vectorized kernels.
+    while True:
+        line = _readline(prompt)
+        if not line:
+            raise EOFError
+        s = line.strip()
+        if s.lower() in {"q", "quit", "exit"}:
+            raise KeyboardInterrupt
+        try:
+            with warnings.catch_warnings():
+                # Older NumPy only warns (and truncates) on unparsable text.
+                warnings.simplefilter("error", DeprecationWarning)
+                a = np.fromstring(s, dtype=np.float64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            print("Please enter valid numbers separated by spaces (or type 'q' to quit).")
+            continue
+        if a.size != n:
+            print("Expected %d values, got %d. Try again, or type 'q' to quit." % (n, a.size))
+            continue
+        if not allow_zero and (a == 0.0).any():
+            print("Values cannot be zero. Enter non-zero values, or type 'q' to quit.")
+            continue
+        if min_val is not None and (a < min_val).any():
+            print("Values must be ≥ %s. Try again, or type 'q' to quit." % min_val)
+            continue
+        if max_val is not None and (a > max_val).any():
+            print("Values must be ≤ %s. Try again, or type 'q' to quit." % max_val)
+            continue
+        return a
+
+def ask_text(prompt):
+    while True:
+        line = _readline(prompt)
+        if not line:
+            raise EOFError
+        s = line.strip()
+        if s.lower() in {"q", "quit", "exit"}:
+            raise KeyboardInterrupt
+        if s:
+            return s
 
 def press_enter():
-    input("\nPress Enter to continue...")
+    if _INTERACTIVE:
+        input("\nPress Enter to continue...")
+
+# ---------- Menu tables ----------
+# Prompt text for each input, keyed by parameter name.
+PROMPTS = {
+    "KW":   "Enter KW: ",
+    "KVA":  "Enter KVA: ",
+    "W":    "Enter W (Watts): ",
+    "V":    "Enter V (Volts): ",
+    "V_LL": "Enter V_LINE-TO-LINE (Volts): ",
+    "I":    "Enter I (Amps): ",
+    "PF":   "Enter PF (0–1): ",
+}
+
+# Each menu maps option -> (label, parameter names, equation function).
+AMPS_CHOICES = {
+    "1": ("Single-phase: from KW",                     ("KW", "V", "PF"),    amps_single_from_kw),
+    "2": ("Single-phase: from KVA",                    ("KVA", "V"),         amps_single_from_kva),
+    "3": ("Single-phase: from W",                      ("W", "V", "PF"),     amps_single_from_w),
+    "4": ("Three-phase (V is LINE-TO-LINE): from KW",  ("KW", "V_LL", "PF"), amps_three_from_kw),
+    "5": ("Three-phase (V is LINE-TO-LINE): from KVA", ("KVA", "V_LL"),      amps_three_from_kva),
+    "6": ("Three-phase (V is LINE-TO-LINE): from W",   ("W", "V_LL", "PF"),  amps_three_from_w),
+}
+KW_CHOICES = {
+    "1": ("Single-phase: from V, I, PF",                    ("V", "I", "PF"),    kw_single),
+    "2": ("Three-phase (V is LINE-TO-LINE): from V, I, PF", ("V_LL", "I", "PF"), kw_three),
+}
+KVA_CHOICES = {
+    "1": ("Single-phase: from V, I",                    ("V", "I"),    kva_single),
+    "2": ("Three-phase (V is LINE-TO-LINE): from V, I", ("V_LL", "I"), kva_three),
+}
+
+# Extra ask_float() keywords per parameter, for each menu.
+# PF divides in the amps formulas, so zero is only allowed when computing KW.
+AMPS_CONSTRAINTS = {"PF": dict(min_val=0.0, max_val=1.0)}
+KW_CONSTRAINTS   = {"PF": dict(min_val=0.0, max_val=1.0, allow_zero=True)}
+KVA_CONSTRAINTS  = {}
 
-# ---------- Core equation functions ----------
-# Amps (I)
-def amps_single_from_kw(KW, V, PF):   return (1000.0*KW)/(V*PF)
-def amps_single_from_kva(KVA, V):     return (1000.0*KVA)/V
-def amps_single_from_w(W, V, PF):     return W/(V*PF)
+# Menu banners, assembled once at import and written in a single call.
+def _menu_banner(title, choices, sweep=False):
+    lines = ["", f"--- {title} ---"]
+    lines += [f"{key}) {label}" for key, (label, _, _) in choices.items()]
+    if sweep:
+        lines.append("s) Sweep: paste several values for each input")
+    lines.append("0) Back to main menu")
+    return "\n".join(lines) + "\n"
 
-def amps_three_from_kw(KW, V, PF):    return (1000.0*KW)/(SQRT3*V*PF)  # V is line-to-line
-def amps_three_from_kva(KVA, V):      return (1000.0*KVA)/(SQRT3*V)
-def amps_three_from_w(W, V, PF):      return W/(SQRT3*V*PF)
+_AMPS_BANNER = _menu_banner("Calculate Amps (I)", AMPS_CHOICES, sweep=True)
+_KW_BANNER   = _menu_banner("Calculate Real Power (KW)", KW_CHOICES)
+_KVA_BANNER  = _menu_banner("Calculate Apparent Power (KVA)", KVA_CHOICES)
 
-# Real Power (KW)
-def kw_single(V, I, PF):              return (V*I*PF)/1000.0
-def kw_three(V, I, PF):               return (SQRT3*V*I*PF)/1000.0
+def report_amps(I):
+    print(f"\nI = {pretty_number(I)} A")
 
-# Apparent Power (KVA)
-def kva_single(V, I):                  return (V*I)/1000.0
-def kva_three(V, I):                   return (SQRT3*V*I)/1000.0
+def report_kw(KW):
+    W = KW*1000.0
+    print(f"\nKW = {pretty_number(KW)} kW  (W = {pretty_number(W)} W)")
+
+def report_kva(KVA):
+    VA = KVA*1000.0
+    print(f"\nKVA = {pretty_number(KVA)} kVA  (VA = {pretty_number(VA)} VA)")
 
 # ---------- Menu handlers ----------
-def menu_amps():
+def run_menu(banner, choices, constraints, report, sweep=False):
     while True:
-        print("\n--- Calculate Amps (I) ---")
-        print("1) Single-phase: from KW")
-        print("2) Single-phase: from KVA")
-        print("3) Single-phase: from W")
-        print("4) Three-phase (V is LINE-TO-LINE): from KW")
-        print("5) Three-phase (V is LINE-TO-LINE): from KVA")
-        print("6) Three-phase (V is LINE-TO-LINE): from W")
-        print("0) Back to main menu")
+        if _INTERACTIVE:
+            sys.stdout.write(banner)
         choice = input("Choose an option: ").strip()
         if choice == "0":
             return
+        if sweep and choice.lower() == "s":
+            run_sweep(choices, constraints, report)
+            continue
+        meta = choices.get(choice)
+        if meta is None:
+            print("Invalid option.")
+            continue
+        _, params, fn = meta
         try:
-            if choice == "1":
-                KW = ask_float("Enter KW: ")
-                V  = ask_float("Enter V (Volts): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0)
-                I  = amps_single_from_kw(KW, V, PF)
-                print(f"\nI = {pretty_number(I)} A")
-            elif choice == "2":
-                KVA = ask_float("Enter KVA: ")
-                V   = ask_float("Enter V (Volts): ")
-                I   = amps_single_from_kva(KVA, V)
-                print(f"\nI = {pretty_number(I)} A")
-            elif choice == "3":
-                W  = ask_float("Enter W (Watts): ")
-                V  = ask_float("Enter V (Volts): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0)
-                I  = amps_single_from_w(W, V, PF)
-                print(f"\nI = {pretty_number(I)} A")
-            elif choice == "4":
-                KW = ask_float("Enter KW: ")
-                V  = ask_float("Enter V_LINE-TO-LINE (Volts): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0)
-                I  = amps_three_from_kw(KW, V, PF)
-                print(f"\nI = {pretty_number(I)} A")
-            elif choice == "5":
-                KVA = ask_float("Enter KVA: ")
-                V   = ask_float("Enter V_LINE-TO-LINE (Volts): ")
-                I   = amps_three_from_kva(KVA, V)
-                print(f"\nI = {pretty_number(I)} A")
-            elif choice == "6":
-                W  = ask_float("Enter W (Watts): ")
-                V  = ask_float("Enter V_LINE-TO-LINE (Volts): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0)
-                I  = amps_three_from_w(W, V, PF)
-                print(f"\nI = {pretty_number(I)} A")
-            else:
-                print("Invalid option.")
-                continue
+            args = [ask_float(PROMPTS[p], **constraints.get(p, {})) for p in params]
+            report(fn(*args))
             press_enter()
         except KeyboardInterrupt:
             print("\nReturning to previous menu...")
             return
 
+def run_sweep(choices, constraints, report):
+    # Every input is pasted as one line of n values; the equation then runs
+    # once over the resulting arrays.
+    try:
+        meta = choices.get(ask_text("Sweep which option? "))
+        if meta is None:
+            print("Invalid option.")
+            return
+        _, params, fn = meta
+        n = ask_int("Number of points: ", min_val=1)
+        args = [ask_floats_line(PROMPTS[p], n, **constraints.get(p, {})) for p in params]
+        for value in fn(*args):
+            report(value)
+        press_enter()
+    except KeyboardInterrupt:
+        print("\nReturning to previous menu...")
+
+def menu_amps():
+    run_menu(_AMPS_BANNER, AMPS_CHOICES, AMPS_CONSTRAINTS, report_amps, sweep=True)
+
 def menu_kw():
-    while True:
-        print("\n--- Calculate Real Power (KW) ---")
-        print("1) Single-phase: from V, I, PF")
-        print("2) Three-phase (V is LINE-TO-LINE): from V, I, PF")
-        print("0) Back to main menu")
-        choice = input("Choose an option: ").strip()
-        if choice == "0":
+    run_menu(_KW_BANNER, KW_CHOICES, KW_CONSTRAINTS, report_kw)
+
+def menu_kva():
+    run_menu(_KVA_BANNER, KVA_CHOICES, KVA_CONSTRAINTS, report_kva)
+
+# Calculation groups offered by the CSV batch mode: (label, choices, constraints).
+BATCH_GROUPS = {
+    "1": ("Amps (I)",              AMPS_CHOICES, AMPS_CONSTRAINTS),
+    "2": ("Real Power (KW)",       KW_CHOICES,   KW_CONSTRAINTS),
+    "3": ("Apparent Power (KVA)",  KVA_CHOICES,  KVA_CONSTRAINTS),
+}
+
+_BATCH_BANNER = "\n".join(
+    ["", "--- Batch from CSV ---"]
+    + [f"{key}) {label}" for key, (label, _, _) in BATCH_GROUPS.items()]
+) + "\n"
+
+def invalid_rows(arr, params, constraints):
+    # Mask of rows that ask_float() would have rejected: missing/unparsable
+    # values, zeros (unless allowed) and out-of-range values.
+    bad = np.isnan(arr).any(axis=1)
+    for col, p in zip(arr.T, params):
+        c = constraints.get(p, {})
+        if not c.get("allow_zero", False):
+            bad |= col == 0.0
+        if c.get("min_val") is not None:
+            bad |= col < c["min_val"]
+        if c.get("max_val") is not None:
+            bad |= col > c["max_val"]
+    return bad
+
+def menu_batch():
+    # Each CSV row holds one set of inputs, in the order the interactive menu
+    # asks for them. All rows are loaded into one float64 array and the chosen
+    # equation runs once over whole columns instead of row by row. Output
+    # line k is the result for data row k, so a file with any invalid row is
+    # rejected (listing the rows) rather than partially written.
+    if _INTERACTIVE:
+        sys.stdout.write(_BATCH_BANNER)
+    try:
+        group = BATCH_GROUPS.get(ask_text("Choose what to calculate: "))
+        if group is None:
+            print("Invalid option.")
             return
-        try:
-            if choice == "1":
-                V  = ask_float("Enter V (Volts): ")
-                I  = ask_float("Enter I (Amps): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0, allow_zero=True)
-                KW = kw_single(V, I, PF)
-                print(f"\nKW = {pretty_number(KW)} kW  (W = {pretty_number(KW*1000)} W)")
-            elif choice == "2":
-                V  = ask_float("Enter V_LINE-TO-LINE (Volts): ")
-                I  = ask_float("Enter I (Amps): ")
-                PF = ask_float("Enter PF (0–1): ", min_val=0.0, max_val=1.0, allow_zero=True)
-                KW = kw_three(V, I, PF)
-                print(f"\nKW = {pretty_number(KW)} kW  (W = {pretty_number(KW*1000)} W)")
-            else:
-                print("Invalid option.")
-                continue
-            press_enter()
-        except KeyboardInterrupt:
-            print("\nReturning to previous menu...")
+        _, choices, constraints = group
+        if _INTERACTIVE:
+            for key, (label, params, _) in choices.items():
+                print(f"{key}) {label}  [columns: {', '.join(params)}]")
+        meta = choices.get(ask_text("Choose an option: "))
+        if meta is None:
+            print("Invalid option.")
             return
+        _, params, fn = meta
+        path     = ask_text("Input CSV path: ")
+        out_path = ask_text("Output file path: ")
 
-def menu_kva():
-    while True:
-        print("\n--- Calculate Apparent Power (KVA) ---")
-        print("1) Single-phase: from V, I")
-        print("2) Three-phase (V is LINE-TO-LINE): from V, I")
-        print("0) Back to main menu")
-        choice = input("Choose an option: ").strip()
-        if choice == "0":
+        with warnings.catch_warnings():
+            # An empty file is reported below as "no data rows" instead.
+            warnings.filterwarnings("ignore", ".*Empty input file", UserWarning)
+            arr = np.genfromtxt(path, delimiter=",", dtype=np.float64, ndmin=2)
+        if arr.shape[0] and np.isnan(arr[0]).all():
+            arr = arr[1:]  # header row
+        if arr.shape[0] == 0:
+            print(f"{path} has no data rows. Nothing was written.")
             return
-        try:
-            if choice == "1":
-                V   = ask_float("Enter V (Volts): ")
-                I   = ask_float("Enter I (Amps): ")
-                KVA = kva_single(V, I)
-                print(f"\nKVA = {pretty_number(KVA)} kVA  (VA = {pretty_number(KVA*1000)} VA)")
-            elif choice == "2":
-                V   = ask_float("Enter V_LINE-TO-LINE (Volts): ")
-                I   = ask_float("Enter I (Amps): ")
-                KVA = kva_three(V, I)
-                print(f"\nKVA = {pretty_number(KVA)} kVA  (VA = {pretty_number(KVA*1000)} VA)")
-            else:
-                print("Invalid option.")
-                continue
-            press_enter()
-        except KeyboardInterrupt:
-            print("\nReturning to previous menu...")
+        if arr.shape[1] != len(params):
+            print(f"Expected {len(params)} columns ({', '.join(params)}), found {arr.shape[1]}.")
             return
+        bad = invalid_rows(arr, params, constraints)
+        if bad.any():
+            rows = ", ".join(str(r) for r in np.flatnonzero(bad)[:10] + 1)
+            more = " ..." if bad.sum() > 10 else ""
+            print(f"{bad.sum()} of {arr.shape[0]} data rows have missing, zero or out-of-range "
+                  f"values (rows {rows}{more}). Nothing was written.")
+            return
+        columns = np.ascontiguousarray(arr.T)
+        result = fn(*columns)
+        np.savetxt(out_path, result, fmt="%.6g")
+        print(f"\nWrote {result.size} results to {out_path}")
+        press_enter()
+    except OSError as e:
+        print(f"File error: {e}")
+    except ValueError as e:  # e.g. rows with differing column counts
+        print(f"Could not read {path}: {e}")
+    except KeyboardInterrupt:
+        print("\nReturning to previous menu...")
+
+_MAIN_BANNER = "\n".join([
+    "",
+    "==============================",
+    " Basic EE Equations Calculator",
+    "==============================",
+    "Note: For THREE-PHASE, V must be LINE-TO-LINE (V_LL).",
+    "",
+    "Choose what to calculate:",
+    "1) Amps (I)",
+    "2) Real Power (KW)",
+    "3) Apparent Power (KVA)",
+    "b) Batch from CSV",
+    "q) Quit",
+]) + "\n"
 
 def main_menu():
     while True:
-        print("\n==============================")
-        print(" Basic EE Equations Calculator")
-        print("==============================")
-        print("Note: For THREE-PHASE, V must be LINE-TO-LINE (V_LL).")
-        print("\nChoose what to calculate:")
-        print("1) Amps (I)")
-        print("2) Real Power (KW)")
-        print("3) Apparent Power (KVA)")
-        print("q) Quit")
+        if _INTERACTIVE:
+            sys.stdout.write(_MAIN_BANNER)
         choice = input("Your choice: ").strip().lower()
         if choice in {"q", "quit", "exit"}:
             print("Goodbye!")
@@ -224,11 +348,13 @@ def main_menu():
             menu_kw()
         elif choice == "3":
             menu_kva()
+        elif choice == "b":
+            menu_batch()
         else:
             print("Invalid option.")
 
 if __name__ == "__main__":
     try:
         main_menu()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         print("\nExiting. Goodbye!")
@@ -0,0 +1,37 @@
+# cython: language_level=3
+"""
+Compiled versions of the scalar equation kernels in ee_equations.py.
+
+Each function takes plain floats and returns a float. ee_equations only
+calls these for plain-number arguments; arrays go to its NumPy/Numba
+kernels. Division keeps Python semantics (no cdivision), so a zero divisor
+raises ZeroDivisionError exactly like the pure-Python scalar kernels.
+
+Build in place from this directory with:
+
+    python setup.py build_ext --inplace
+"""
+from libc.math cimport sqrt
+
+cdef double SQRT3 = sqrt(3.0)
+cdef double _INV_SQRT3 = 1.0/SQRT3
+cdef double _INV_SQRT3_1000 = 1000.0/SQRT3
+cdef double _SQRT3_DIV_1000 = SQRT3*1e-3
+cdef double _INV_1000 = 1e-3
+
+# Amps (I)
+cpdef double amps_single_from_kw(double KW, double V, double PF) nogil:  return 1000.0*KW/(V*PF)
+cpdef double amps_single_from_kva(double KVA, double V) nogil:           return 1000.0*KVA/V
+cpdef double amps_single_from_w(double W, double V, double PF) nogil:    return W/(V*PF)
+
+cpdef double amps_three_from_kw(double KW, double V, double PF) nogil:   return _INV_SQRT3_1000*KW/(V*PF)  # V is line-to-line
+cpdef double amps_three_from_kva(double KVA, double V) nogil:            return _INV_SQRT3_1000*KVA/V
+cpdef double amps_three_from_w(double W, double V, double PF) nogil:     return _INV_SQRT3*W/(V*PF)
+
+# Real Power (KW)
+cpdef double kw_single(double V, double I, double PF) nogil:             return V*I*PF*_INV_1000
+cpdef double kw_three(double V, double I, double PF) nogil:              return _SQRT3_DIV_1000*V*I*PF
+
+# Apparent Power (KVA)
+cpdef double kva_single(double V, double I) nogil:                       return V*I*_INV_1000
+cpdef double kva_three(double V, double I) nogil:                        return _SQRT3_DIV_1000*V*I
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Basic Electrical Engineering Equations
+
+The equation kernels and output formatting, importable without side
+effects. The interactive calculator lives in Basic-EE-Equations.py.
+
+Variables (as requested):
+I  = Amps
+V  = Volts (RMS). For THREE-PHASE, use LINE-TO-LINE voltage (V_LL).
+KVA = Kilo Volt-Amps (apparent power)
+KW  = Kilo Watts (real power)
+PF  = Power Factor (0–1)
+W   = Watts (real power)
+
+Formulas implemented:
+
+Single-phase
+------------
+I   = (1000*KW) / (V*PF)
+I   = (1000*KVA) / V
+I   =  W / (V*PF)
+
+KW  = (V*I*PF) / 1000            => W = V*I*PF
+KVA = (V*I) / 1000               =>  VA = V*I
+
+Three-phase (balanced, using line-to-line voltage V)
+---------------------------------------------------
+I   = (1000*KW) / (sqrt(3)*V*PF)
+I   = (1000*KVA) / (sqrt(3)*V)
+I   =  W / (sqrt(3)*V*PF)
+
+KW  = (sqrt(3)*V*I*PF) / 1000    => W  = sqrt(3)*V*I*PF
+KVA = (sqrt(3)*V*I) / 1000       => VA = sqrt(3)*V*I
+
+Handy relations: KW = KVA * PF, and W = 1000*KW, VA = 1000*KVA
+
+The equation functions are NumPy-vectorized: pass arrays of V, I, PF, ... to
+evaluate many operating points in one call (see batch_amps_three_from_kw).
+"""
+from functools import lru_cache, wraps
+from math import copysign, sqrt
+
+import numpy as np
+
+__all__ = [
+    "SQRT3",
+    "amps_single_from_kw", "amps_single_from_kva", "amps_single_from_w",
+    "amps_three_from_kw", "amps_three_from_kva", "amps_three_from_w",
+    "kw_single", "kw_three",
+    "kva_single", "kva_three",
+    "batch_amps_three_from_kw", "kw_three_batch",
+    "pretty_number",
+]
+
+SQRT3 = sqrt(3.0)
+
+# Folded constants: turn the per-call divisions by 1000 and sqrt(3) into
+# a single multiply. Plain Python floats, so the scalar kernels stay in float
+# arithmetic (float results, ZeroDivisionError on a zero divisor); the NumPy
+# and Numba kernels take them as float64 without needing NumPy scalars here.
+_INV_SQRT3       = 1.0/SQRT3
+_INV_SQRT3_1000  = 1000.0/SQRT3
+_SQRT3_DIV_1000  = SQRT3*1e-3
+_INV_1000        = 1e-3
+
+# ---------- Core equation functions ----------
+# Every equation has two implementations behind one name: a plain-Python
+# scalar kernel for float/int arguments (what the interactive menus pass) and
+# a NumPy kernel for everything else. The NumPy kernels broadcast element-wise,
+# so one call can evaluate a whole sweep; pass out= to write into an existing
+# float64 buffer.
+
+# Scalar kernels. Module constants are bound as keyword-only default arguments
+# so they are read as fast locals rather than looked up as globals on every
+# call, while a stray extra positional argument still raises TypeError.
+def _amps_single_from_kw(KW, V, PF):                          return 1000.0*KW/(V*PF)
+def _amps_single_from_kva(KVA, V):                            return 1000.0*KVA/V
+def _amps_single_from_w(W, V, PF):                            return W/(V*PF)
+
+def _amps_three_from_kw(KW, V, PF, *, _K=_INV_SQRT3_1000):    return _K*KW/(V*PF)  # V is line-to-line
+def _amps_three_from_kva(KVA, V, *, _K=_INV_SQRT3_1000):      return _K*KVA/V
+def _amps_three_from_w(W, V, PF, *, _K=_INV_SQRT3):           return _K*W/(V*PF)
+
+def _kw_single(V, I, PF, *, _IK=_INV_1000):                   return V*I*PF*_IK
+def _kw_three(V, I, PF, *, _K=_SQRT3_DIV_1000):               return _K*V*I*PF
+
+def _kva_single(V, I, *, _IK=_INV_1000):                      return V*I*_IK
+def _kva_three(V, I, *, _K=_SQRT3_DIV_1000):                  return _K*V*I
+
+# Optional Cython build of the scalar kernels, see _ee_equations.pyx. It sits
+# next to this file, so it's a sibling module whether this one is imported as
+# logic.ee_equations or as a top-level ee_equations.
+try:
+    from . import _ee_equations as _compiled
+except ImportError:
+    try:
+        import _ee_equations as _compiled
+    except ImportError:
+        _compiled = None
+
+if _compiled is not None:
+    _amps_single_from_kw  = _compiled.amps_single_from_kw
+    _amps_single_from_kva = _compiled.amps_single_from_kva
+    _amps_single_from_w   = _compiled.amps_single_from_w
+    _amps_three_from_kw   = _compiled.amps_three_from_kw
+    _amps_three_from_kva  = _compiled.amps_three_from_kva
+    _amps_three_from_w    = _compiled.amps_three_from_w
+    _kw_single            = _compiled.kw_single
+    _kw_three             = _compiled.kw_three
+    _kva_single           = _compiled.kva_single
+    _kva_three            = _compiled.kva_three
+
+# Array kernels
+def _amps_single_from_kw_np(KW, V, PF, out=None):  return np.divide(np.multiply(1000.0, KW), np.multiply(V, PF), out=out)
+def _amps_single_from_kva_np(KVA, V, out=None):    return np.divide(np.multiply(1000.0, KVA), V, out=out)
+def _amps_single_from_w_np(W, V, PF, out=None):    return np.divide(W, np.multiply(V, PF), out=out)
+
+def _amps_three_from_kw_np(KW, V, PF, out=None):   return np.divide(np.multiply(_INV_SQRT3_1000, KW), np.multiply(V, PF), out=out)
+def _amps_three_from_kva_np(KVA, V, out=None):     return np.divide(np.multiply(_INV_SQRT3_1000, KVA), V, out=out)
+def _amps_three_from_w_np(W, V, PF, out=None):     return np.divide(np.multiply(_INV_SQRT3, W), np.multiply(V, PF), out=out)
+
+def _kw_single_np(V, I, PF, out=None):             return np.multiply(np.multiply(np.multiply(V, I), PF), _INV_1000, out=out)
+def _kw_three_np(V, I, PF, out=None):              return kw_three_batch(V, I, PF, out=out)
+
+def _kva_single_np(V, I, out=None):                return np.multiply(np.multiply(V, I), _INV_1000, out=out)
+def _kva_three_np(V, I, out=None):                 return np.multiply(np.multiply(V, I), _SQRT3_DIV_1000, out=out)
+
+# With numba installed, the array kernels below are compiled into NumPy
+# ufuncs with the same call surface (broadcasting, out=). Both the numba
+# import and the compile happen on the first array call of each equation, so
+# importing this module, and the CLI's plain-float calls, never pay for the
+# JIT. No on-disk cache: its entries record the importing module's name, so a
+# cache written via `ee_equations` breaks a later `import logic.ee_equations`.
+def _numba_ufunc(kernel, nin, fallback):
+    ufunc = None
+    def call(*args, **kwargs):
+        nonlocal ufunc
+        if ufunc is None:
+            try:
+                from numba import float64, vectorize
+            except ImportError:  # numba is optional; keep the NumPy version
+                ufunc = fallback
+            else:
+                sig = float64(*(float64,)*nin)
+                ufunc = vectorize([sig], nopython=True, fastmath=True)(kernel)
+        return ufunc(*args, **kwargs)
+    return call
+
+def _amps_single_from_kw_nb(KW, V, PF):   return 1000.0*KW/(V*PF)
+def _amps_single_from_kva_nb(KVA, V):     return 1000.0*KVA/V
+def _amps_single_from_w_nb(W, V, PF):     return W/(V*PF)
+
+def _amps_three_from_kw_nb(KW, V, PF):    return _INV_SQRT3_1000*KW/(V*PF)
+def _amps_three_from_kva_nb(KVA, V):      return _INV_SQRT3_1000*KVA/V
+def _amps_three_from_w_nb(W, V, PF):      return _INV_SQRT3*W/(V*PF)
+
+def _kw_single_nb(V, I, PF):              return V*I*PF*_INV_1000
+def _kw_three_nb(V, I, PF):               return _SQRT3_DIV_1000*V*I*PF
+
+def _kva_single_nb(V, I):                 return V*I*_INV_1000
+def _kva_three_nb(V, I):                  return _SQRT3_DIV_1000*V*I
+
+_amps_single_from_kw_np  = _numba_ufunc(_amps_single_from_kw_nb,  3, _amps_single_from_kw_np)
+_amps_single_from_kva_np = _numba_ufunc(_amps_single_from_kva_nb, 2, _amps_single_from_kva_np)
+_amps_single_from_w_np   = _numba_ufunc(_amps_single_from_w_nb,   3, _amps_single_from_w_np)
+
+_amps_three_from_kw_np   = _numba_ufunc(_amps_three_from_kw_nb,   3, _amps_three_from_kw_np)
+_amps_three_from_kva_np  = _numba_ufunc(_amps_three_from_kva_nb,  2, _amps_three_from_kva_np)
+_amps_three_from_w_np    = _numba_ufunc(_amps_three_from_w_nb,    3, _amps_three_from_w_np)
+
+_kw_single_np            = _numba_ufunc(_kw_single_nb,            3, _kw_single_np)
+_kw_three_np             = _numba_ufunc(_kw_three_nb,             3, _kw_three_np)
+
+_kva_single_np           = _numba_ufunc(_kva_single_nb,           2, _kva_single_np)
+_kva_three_np            = _numba_ufunc(_kva_three_nb,            2, _kva_three_np)
+
+# Public equations: one name, two implementations. Plain float/int arguments
+# take the scalar kernel; arrays, lists and out= take the array kernel. The
+# wrappers have a fixed arity and test each argument directly (no *args
+# repacking or generator), keeping the dispatch cost close to the kernel's.
+_NUM = (float, int)
+
+def _finish(wrapper, f_scalar, doc):
+    wrapper.__name__ = wrapper.__qualname__ = f_scalar.__name__.lstrip("_")
+    wrapper.__doc__ = doc + "\n\nScalars return a float; arrays broadcast, and out= is accepted."
+    return wrapper
+
+def _vec2(f_scalar, f_array, doc):
+    @wraps(f_scalar)
+    def wrapper(a, b, *, out=None, _N=_NUM):
+        if out is None and isinstance(a, _N) and isinstance(b, _N):
+            return f_scalar(a, b)
+        return f_array(a, b, out=out)
+    return _finish(wrapper, f_scalar, doc)
+
+def _vec3(f_scalar, f_array, doc):
+    @wraps(f_scalar)
+    def wrapper(a, b, c, *, out=None, _N=_NUM):
+        if out is None and isinstance(a, _N) and isinstance(b, _N) and isinstance(c, _N):
+            return f_scalar(a, b, c)
+        return f_array(a, b, c, out=out)
+    return _finish(wrapper, f_scalar, doc)
+
+# Amps (I)
+amps_single_from_kw  = _vec3(_amps_single_from_kw,  _amps_single_from_kw_np,  "Single-phase I = (1000*KW) / (V*PF).")
+amps_single_from_kva = _vec2(_amps_single_from_kva, _amps_single_from_kva_np, "Single-phase I = (1000*KVA) / V.")
+amps_single_from_w   = _vec3(_amps_single_from_w,   _amps_single_from_w_np,   "Single-phase I = W / (V*PF).")
+
+amps_three_from_kw   = _vec3(_amps_three_from_kw,   _amps_three_from_kw_np,   "Three-phase I = (1000*KW) / (sqrt(3)*V_LL*PF).")
+amps_three_from_kva  = _vec2(_amps_three_from_kva,  _amps_three_from_kva_np,  "Three-phase I = (1000*KVA) / (sqrt(3)*V_LL).")
+amps_three_from_w    = _vec3(_amps_three_from_w,    _amps_three_from_w_np,    "Three-phase I = W / (sqrt(3)*V_LL*PF).")
+
+# Real Power (KW)
+kw_single            = _vec3(_kw_single,            _kw_single_np,            "Single-phase KW = (V*I*PF) / 1000.")
+kw_three             = _vec3(_kw_three,             _kw_three_np,             "Three-phase KW = (sqrt(3)*V_LL*I*PF) / 1000.")
+
+# Apparent Power (KVA)
+kva_single           = _vec2(_kva_single,           _kva_single_np,           "Single-phase KVA = (V*I) / 1000.")
+kva_three            = _vec2(_kva_three,            _kva_three_np,            "Three-phase KVA = (sqrt(3)*V_LL*I) / 1000.")
+
+# ---------- Batch entry points ----------
+def batch_amps_three_from_kw(KW_arr, V_arr, PF_arr, out=None):
+    """Three-phase amps for a sweep of (KW, V_LL, PF) samples.
+
+    The inputs are converted to float64 arrays and broadcast against each
+    other, so e.g. a column of loads can be swept against a single voltage.
+    Returns a float64 array (or writes into and returns `out`).
+    """
+    KW_arr = np.asarray(KW_arr, dtype=np.float64)
+    V_arr  = np.asarray(V_arr, dtype=np.float64)
+    PF_arr = np.asarray(PF_arr, dtype=np.float64)
+    return amps_three_from_kw(KW_arr, V_arr, PF_arr, out=out)
+
+def kw_three_batch(V_arr, I_arr, PF_arr, out=None):
+    """Three-phase KW for a sweep of (V_LL, I, PF) samples.
+
+    Works in a single float64 buffer: V*I is written into `out` (allocated
+    if not given), then multiplied by PF and by the folded sqrt(3)/1000 in
+    place, so no intermediate arrays are created.
+    """
+    V_arr  = np.asarray(V_arr, dtype=np.float64)
+    I_arr  = np.asarray(I_arr, dtype=np.float64)
+    PF_arr = np.asarray(PF_arr, dtype=np.float64)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(V_arr.shape, I_arr.shape, PF_arr.shape))
+    np.multiply(V_arr, I_arr, out=out)
+    np.multiply(out, PF_arr, out=out)
+    out *= _SQRT3_DIV_1000
+    return out
+
+# ---------- Formatting ----------
+# Formats for |x| >= 100, 1 <= |x| < 100 and |x| < 1, indexed by how many of
+# the two thresholds |x| falls below.
+_FMTS = ("{:,.2f}", "{:,.4f}", "{:.6f}")
+
+def pretty_number(x):
+    # Format numbers sensibly for engineering style outputs.
+    x = float(x)  # NumPy scalars compare to numpy.bool, which can't index
+    return _pretty_number(x, copysign(1.0, x))
+
+@lru_cache(maxsize=1024)
+def _pretty_number(x, sign):
+    # Cached: re-running a menu option with the same inputs reuses the string.
+    # `sign` is only part of the key: 0.0 == -0.0, so without it the cache
+    # would hand back whichever zero was formatted first.
+    a = x if x >= 0 else -x
+    return _FMTS[(a < 100) + (a < 1)].format(x)
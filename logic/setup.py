@@ -0,0 +1,7 @@
+from Cython.Build import cythonize
+from setuptools import setup
+
+# Builds the optional _ee_equations extension; see _ee_equations.pyx.
+setup(
+    ext_modules=cythonize("_ee_equations.pyx"),
+)
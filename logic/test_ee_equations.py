@@ -0,0 +1,185 @@
+import subprocess
+import sys
+from math import copysign, sqrt
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import ee_equations as ee
+
+S3 = sqrt(3.0)
+CLI = Path(__file__).with_name("Basic-EE-Equations.py")
+
+
+def run_cli(*lines):
+    # Drive the menus with piped stdin, as a scripted caller would.
+    proc = subprocess.run(
+        [sys.executable, str(CLI)], input="\n".join(lines) + "\n",
+        capture_output=True, text=True, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Traceback" not in proc.stderr
+    assert "Warning" not in proc.stderr
+    return proc.stdout
+
+
+# (equation, sample inputs, expected result)
+CASES = [
+    (ee.amps_single_from_kw,  (10.0, 120.0, 0.9),   10000.0/(120.0*0.9)),
+    (ee.amps_single_from_kva, (10.0, 120.0),        10000.0/120.0),
+    (ee.amps_single_from_w,   (1000.0, 120.0, 0.9), 1000.0/(120.0*0.9)),
+    (ee.amps_three_from_kw,   (10.0, 480.0, 0.9),   10000.0/(S3*480.0*0.9)),
+    (ee.amps_three_from_kva,  (10.0, 480.0),        10000.0/(S3*480.0)),
+    (ee.amps_three_from_w,    (1000.0, 480.0, 0.9), 1000.0/(S3*480.0*0.9)),
+    (ee.kw_single,            (120.0, 10.0, 0.9),   120.0*10.0*0.9/1000.0),
+    (ee.kw_three,             (480.0, 10.0, 0.9),   S3*480.0*10.0*0.9/1000.0),
+    (ee.kva_single,           (120.0, 10.0),        120.0*10.0/1000.0),
+    (ee.kva_three,            (480.0, 10.0),        S3*480.0*10.0/1000.0),
+]
+IDS = [f.__name__ for f, _, _ in CASES]
+
+
+@pytest.mark.parametrize("fn, args, expected", CASES, ids=IDS)
+def test_scalar_call_returns_float(fn, args, expected):
+    result = fn(*args)
+    assert type(result) is float
+    assert result == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("fn, args, expected", CASES, ids=IDS)
+def test_array_call_matches_scalar(fn, args, expected):
+    arrays = [np.full(4, a) for a in args]
+    result = fn(*arrays)
+    assert result.shape == (4,)
+    np.testing.assert_allclose(result, fn(*args), rtol=1e-12)
+
+
+@pytest.mark.parametrize("fn, args, expected", CASES, ids=IDS)
+def test_array_call_writes_into_out(fn, args, expected):
+    out = np.empty(3)
+    result = fn(*[np.full(3, a) for a in args], out=out)
+    assert result is out
+    np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("fn, args, expected", CASES, ids=IDS)
+def test_wrong_arity_raises(fn, args, expected):
+    with pytest.raises(TypeError):
+        fn(*args, 1.0)
+    with pytest.raises(TypeError):
+        fn(*args[:-1])
+
+
+@pytest.mark.parametrize("fn", [ee.amps_single_from_kva, ee.amps_three_from_kva])
+def test_scalar_zero_divisor_raises(fn):
+    with pytest.raises(ZeroDivisionError):
+        fn(1.0, 0.0)
+
+
+def test_public_metadata():
+    assert ee.kw_three.__name__ == ee.kw_three.__qualname__ == "kw_three"
+    assert "sqrt(3)" in ee.kw_three.__doc__
+
+
+def test_dispatch_routes_scalars_and_arrays():
+    calls = []
+    def scalar(a, b, c):
+        calls.append("scalar")
+        return 0.0
+    def array(a, b, c, out=None):
+        calls.append("array")
+        return out
+    fn = ee._vec3(scalar, array, "doc")
+    fn(1.0, 2, 3.0)
+    fn(np.ones(2), 2.0, 3.0)
+    fn([1.0], 2.0, 3.0)
+    fn(1.0, 2.0, 3.0, out=np.empty(()))
+    assert calls == ["scalar", "array", "array", "array"]
+
+
+@pytest.mark.skipif(ee._compiled is None, reason="Cython extension not built")
+@pytest.mark.parametrize("fn", [f for f, _, _ in CASES], ids=IDS)
+def test_scalar_calls_reach_compiled_kernel(fn):
+    assert fn.__wrapped__ is getattr(ee._compiled, fn.__name__)
+
+
+def test_batch_helpers_broadcast():
+    np.testing.assert_allclose(
+        ee.batch_amps_three_from_kw([10.0, 20.0], 480.0, [0.9, 0.8]),
+        [ee.amps_three_from_kw(10.0, 480.0, 0.9), ee.amps_three_from_kw(20.0, 480.0, 0.8)],
+    )
+    assert ee.kw_three_batch([[1.0], [2.0]], [1.0, 2.0, 3.0], 1.0).shape == (2, 3)
+
+
+@pytest.mark.parametrize("x, expected", [
+    (1234.5, "1,234.50"), (-150, "-150.00"), (99.99, "99.9900"),
+    (1, "1.0000"), (-0.5, "-0.500000"), (np.float64(12.3), "12.3000"),
+])
+def test_pretty_number(x, expected):
+    assert ee.pretty_number(x) == expected
+
+
+@pytest.mark.parametrize("first, second", [(0.0, -0.0), (-0.0, 0.0)])
+def test_pretty_number_keeps_sign_of_zero(first, second):
+    ee.pretty_number(first)
+    assert ee.pretty_number(second) == ("-0.000000" if copysign(1.0, second) < 0 else "0.000000")
+
+
+# ---------- CSV batch mode ----------
+def run_batch(tmp_path, csv_text, group="1", option="4"):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.txt"
+    src.write_text(csv_text)
+    out = run_cli("b", group, option, str(src), str(dst), "q")
+    return out, dst
+
+
+def test_batch_writes_one_result_per_row(tmp_path):
+    out, dst = run_batch(tmp_path, "KW,V,PF\n10,480,0.9\n20,480,0.8\n")
+    assert "Wrote 2 results" in out
+    np.testing.assert_allclose(
+        np.loadtxt(dst),
+        [ee.amps_three_from_kw(10.0, 480.0, 0.9), ee.amps_three_from_kw(20.0, 480.0, 0.8)],
+        rtol=1e-5,
+    )
+
+
+def test_batch_reports_uneven_rows(tmp_path):
+    out, dst = run_batch(tmp_path, "10,480,0.9\n20,480\n")
+    assert "Could not read" in out
+    assert not dst.exists()
+
+
+def test_batch_rejects_rows_failing_constraints(tmp_path):
+    out, dst = run_batch(tmp_path, "10,480,0.9\n20,0,0.8\n5,208,1.2\n")
+    assert "2 of 3 data rows" in out and "rows 2, 3" in out
+    assert not dst.exists()
+
+
+@pytest.mark.parametrize("csv_text", ["", "KW,V,PF\n"], ids=["empty", "header-only"])
+def test_batch_reports_no_data_rows(tmp_path, csv_text):
+    out, dst = run_batch(tmp_path, csv_text)
+    assert "has no data rows. Nothing was written." in out
+    assert not dst.exists()
+
+
+def test_batch_allows_zero_pf_for_kw(tmp_path):
+    out, dst = run_batch(tmp_path, "120,10,0\n", group="2", option="1")
+    assert "Wrote 1 results" in out
+    assert np.loadtxt(dst) == 0.0
+
+
+# ---------- Amps sweep mode ----------
+@pytest.mark.parametrize("bad_count", ["inf", "nan", "2.7", "0"])
+def test_sweep_reprompts_on_bad_point_count(bad_count):
+    out = run_cli("1", "s", "4", bad_count, "2", "10 20", "480 480", "0.9 0.9", "0", "q")
+    assert "Number of points:" in out
+    assert out.count("I = ") == 2
+
+
+def test_sweep_reprompts_on_bad_values():
+    out = run_cli("1", "s", "4", "2", "10 x", "10", "10 20", "480 480", "0.9 1.5", "0.9 0.9", "0", "q")
+    assert "Please enter valid numbers" in out
+    assert "Expected 2 values, got 1" in out
+    assert "Values must be ≤ 1.0" in out
+    assert "I = %s A" % ee.pretty_number(ee.amps_three_from_kw(20.0, 480.0, 0.9)) in out